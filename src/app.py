@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -20,105 +20,118 @@ app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
 # In-memory activity database
+# Participants are insertion-ordered dicts used as sets: O(1) membership checks
+# while keeping signup order
 activities = {
     "Soccer Team": {
         "description": "Join the varsity soccer team and compete against other schools",
         "schedule": "Mondays, Wednesdays, Fridays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
+        "participants": dict.fromkeys(["alex@mergington.edu", "sarah@mergington.edu"])
         },
         "Basketball Team": {
         "description": "Practice basketball skills and play in tournaments",
         "schedule": "Tuesdays, Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "lucas@mergington.edu"]
+        "participants": dict.fromkeys(["james@mergington.edu", "lucas@mergington.edu"])
         },
         "Art Club": {
         "description": "Explore various art forms including painting, drawing, and sculpture",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["emily@mergington.edu", "mia@mergington.edu"]
+        "participants": dict.fromkeys(["emily@mergington.edu", "mia@mergington.edu"])
         },
         "Theater Arts": {
         "description": "Participate in school plays and develop acting and stage skills",
         "schedule": "Mondays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 30,
-        "participants": ["david@mergington.edu", "isabella@mergington.edu"]
+        "participants": dict.fromkeys(["david@mergington.edu", "isabella@mergington.edu"])
         },
         "Debate Team": {
         "description": "Develop critical thinking and public speaking through competitive debates",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["william@mergington.edu", "ava@mergington.edu"]
+        "participants": dict.fromkeys(["william@mergington.edu", "ava@mergington.edu"])
         },
         "Science Olympiad": {
         "description": "Prepare for science competitions and explore advanced scientific concepts",
         "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["noah@mergington.edu", "charlotte@mergington.edu"]
+        "participants": dict.fromkeys(["noah@mergington.edu", "charlotte@mergington.edu"])
         },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     }
 }
 
 
+def get_activities_store():
+    """Provide the activity database to the endpoints (overridable in tests)"""
+    return activities
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities(store: dict = Depends(get_activities_store)):
+    # Participants are serialized as lists of emails in signup order
+    return {
+        name: {**activity, "participants": list(activity["participants"])}
+        for name, activity in store.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        store: dict = Depends(get_activities_store)):
     """Sign up a student for an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in store:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = store[activity_name]
 # Validate student is not already signed up
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             store: dict = Depends(get_activities_store)):
     """Unregister a student from an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in store:
         raise HTTPException(status_code=404, detail="Activity not found")
     
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = store[activity_name]
     
     # Validate student is registered
     if email not in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student not registered for this activity")
     
     # Remove student
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -0,0 +1,75 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import copy
+import functools
+
+import pytest
+
+
+@functools.lru_cache(maxsize=None)
+def _api():
+    """Import the API module on first use so test collection stays cheap"""
+    from src import app as api
+    return api
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the API, shared across the session"""
+    from fastapi.testclient import TestClient
+    
+    # The context manager runs the app's startup/shutdown events exactly once
+    # and keeps one event loop portal open for every request in the session.
+    # httpx.ASGITransport is async-only, so a plain httpx.Client cannot use it.
+    with TestClient(_api().app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def _baseline_participants():
+    """Capture the pristine participants of every activity once per session"""
+    # Tuples keep the baseline ordered and safe from accidental mutation
+    return {
+        name: tuple(activity["participants"])
+        for name, activity in _api().activities.items()
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
+def activities_store():
+    """Give each test module its own copy of the activity database
+
+    The copy acts as a per-module checkpoint: whatever a module mutates is
+    discarded with it, so the shared database never needs restoring.
+    """
+    api = _api()
+    store = copy.deepcopy(api.activities)
+    api.app.dependency_overrides[api.get_activities_store] = lambda: store
+    
+    yield store
+    
+    api.app.dependency_overrides.pop(api.get_activities_store, None)
+
+
+@pytest.fixture(scope="module")
+def activities_response(client, activities_store):
+    """Fetch GET /activities once per module for read-only assertions"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def reset_activities(activities_store, _baseline_participants):
+    """Reset activities data to the session baseline after each test"""
+    # Opt-in rollback for tests whose mutations would affect later tests in the
+    # same module; read-only, fail-fast (404/400) and unique-email signup tests
+    # are already isolated by the module-scoped activities_store.
+    yield
+    
+    # Restore original state in place after test
+    for name, participants in _baseline_participants.items():
+        activities_store[name]["participants"].clear()
+        activities_store[name]["participants"].update(dict.fromkeys(participants))
@@ -2,37 +2,50 @@
 Tests for the Mergington High School Activities API
 """
 
+import functools
+from urllib.parse import quote, urlencode
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the API"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {
-            "description": activity["description"],
-            "schedule": activity["schedule"],
-            "max_participants": activity["max_participants"],
-            "participants": activity["participants"].copy()
-        }
-        for name, activity in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state after test
-    for name, activity in original_activities.items():
-        if name in activities:
-            activities[name]["participants"] = activity["participants"].copy()
+
+
+EMAIL_TEST = "test@mergington.edu"
+EMAIL_TEST_QUERY = urlencode({"email": EMAIL_TEST})
+EMAIL_ALEX = "alex@mergington.edu"  # Already in Soccer Team
+ACT_SOCCER = "Soccer Team"
+ACT_CHESS = "Chess Club"
+ACT_MISSING = "NonExistentActivity"
+
+SIGNUP_URL = "/activities/{}/signup"
+UNREGISTER_URL = "/activities/{}/unregister"
+DETAIL_NOT_FOUND = "Activity not found"
+DETAIL_ALREADY = "already signed up"
+DETAIL_NOT_REGISTERED = "not registered"
+REQUIRED_ACTIVITY_FIELDS = frozenset(
+    {"description", "schedule", "max_participants", "participants"}
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _url(template, activity, email):
+    """Build a fully encoded endpoint URL so requests skip params encoding"""
+    return f"{template.format(quote(activity))}?{urlencode({'email': email})}"
+
+
+def _signup(client, activity, email):
+    """Sign up an email for an activity through the API"""
+    return client.post(_url(SIGNUP_URL, activity, email))
+
+
+def _assert_signup_ok(client, activity, email):
+    """Sign up an email for an activity and assert it succeeded"""
+    response = _signup(client, activity, email)
+    assert response.status_code == 200, f"Signup failed for {email} in {activity}"
+    return response.json()
+
+
+def _unregister(client, activity, email):
+    """Unregister an email from an activity through the API"""
+    return client.delete(_url(UNREGISTER_URL, activity, email))
 
 
 class TestRoot:
@@ -48,173 +61,140 @@ class TestRoot:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all(self, client):
+    def test_get_activities_returns_all(self, activities_response):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        data = activities_response
         
         assert isinstance(data, dict)
         assert len(data) > 0
-        assert "Soccer Team" in data
+        assert ACT_SOCCER in data
         assert "Basketball Team" in data
     
-    def test_activities_have_required_fields(self, client):
+    def test_activities_have_required_fields(self, activities_response):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for name, activity in data.items():
-            assert "description" in activity
-            assert "schedule" in activity
-            assert "max_participants" in activity
-            assert "participants" in activity
-            assert isinstance(activity["participants"], list)
-            assert isinstance(activity["max_participants"], int)
+        for name, activity in activities_response.items():
+            assert REQUIRED_ACTIVITY_FIELDS <= activity.keys(), name
+            # Parsed JSON only yields exact builtin types, so identity checks suffice
+            assert type(activity["participants"]) is list
+            assert type(activity["max_participants"]) is int
 
 
 class TestSignup:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_success(self, client, reset_activities):
+    def test_signup_success(self, client, activities_store):
         """Test successful signup for an activity"""
-        email = "test@mergington.edu"
-        activity = "Soccer Team"
+        email = EMAIL_TEST
+        activity = ACT_SOCCER
         
         # Remove test email if it exists
-        if email in activities[activity]["participants"]:
-            activities[activity]["participants"].remove(email)
+        activities_store[activity]["participants"].pop(email, None)
         
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
+        data = _assert_signup_ok(client, activity, email)
         
-        assert response.status_code == 200
-        data = response.json()
         assert "message" in data
-        assert email in data["message"]
-        assert activity in data["message"]
+        message = data["message"]
+        assert email in message
+        assert activity in message
         
         # Verify participant was added
-        assert email in activities[activity]["participants"]
+        assert email in activities_store[activity]["participants"]
     
     def test_signup_activity_not_found(self, client):
         """Test signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/NonExistentActivity/signup",
-            params={"email": "test@mergington.edu"}
-        )
+        response = _signup(client, ACT_MISSING, EMAIL_TEST)
         
         assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert DETAIL_NOT_FOUND in response.json()["detail"]
     
-    def test_signup_duplicate_participant(self, client, reset_activities):
+    def test_signup_duplicate_participant(self, client):
         """Test that signing up twice returns 400"""
-        email = "alex@mergington.edu"  # Already in Soccer Team
-        activity = "Soccer Team"
+        email = EMAIL_ALEX
+        activity = ACT_SOCCER
         
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
+        response = _signup(client, activity, email)
         
         assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"].lower()
+        detail = response.json()["detail"].lower()
+        assert DETAIL_ALREADY in detail
     
-    def test_signup_multiple_different_activities(self, client, reset_activities):
+    @pytest.mark.parametrize("activity", [ACT_SOCCER, ACT_CHESS])
+    def test_signup_multiple_different_activities(self, client, activities_store, reset_activities, activity):
         """Test that a student can sign up for multiple different activities"""
         email = "multitask@mergington.edu"
         
-        # Sign up for Soccer Team
-        response1 = client.post(
-            "/activities/Soccer Team/signup",
-            params={"email": email}
-        )
-        assert response1.status_code == 200
+        # Sign up for another activity first
+        other_activity = "Art Club"
+        _assert_signup_ok(client, other_activity, email)
         
-        # Sign up for Chess Club
-        response2 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        assert response2.status_code == 200
+        # Sign up for the parametrized activity
+        _assert_signup_ok(client, activity, email)
         
         # Verify in both
-        assert email in activities["Soccer Team"]["participants"]
-        assert email in activities["Chess Club"]["participants"]
+        assert email in activities_store[other_activity]["participants"]
+        assert email in activities_store[activity]["participants"]
 
 
 class TestUnregister:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_success(self, client, reset_activities):
+    def test_unregister_success(self, client, activities_store, reset_activities):
         """Test successful unregistration from an activity"""
-        email = "alex@mergington.edu"  # Already in Soccer Team
-        activity = "Soccer Team"
+        email = EMAIL_ALEX
+        activity = ACT_SOCCER
         
         # Ensure participant is in the activity
-        if email not in activities[activity]["participants"]:
-            activities[activity]["participants"].append(email)
+        activities_store[activity]["participants"][email] = None
         
-        response = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
+        response = _unregister(client, activity, email)
         
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         
         # Verify participant was removed
-        assert email not in activities[activity]["participants"]
+        assert email not in activities_store[activity]["participants"]
     
     def test_unregister_activity_not_found(self, client):
         """Test unregister from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/NonExistentActivity/unregister",
-            params={"email": "test@mergington.edu"}
-        )
+        response = _unregister(client, ACT_MISSING, EMAIL_TEST)
         
         assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert DETAIL_NOT_FOUND in response.json()["detail"]
     
-    def test_unregister_participant_not_registered(self, client, reset_activities):
+    def test_unregister_participant_not_registered(self, client, activities_store):
         """Test unregistering a participant who isn't registered returns 400"""
         email = "notregistered@mergington.edu"
-        activity = "Soccer Team"
+        activity = ACT_SOCCER
         
         # Ensure participant is not in the activity
-        if email in activities[activity]["participants"]:
-            activities[activity]["participants"].remove(email)
+        activities_store[activity]["participants"].pop(email, None)
         
-        response = client.delete(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
+        response = _unregister(client, activity, email)
         
         assert response.status_code == 400
-        assert "not registered" in response.json()["detail"].lower()
+        detail = response.json()["detail"].lower()
+        assert DETAIL_NOT_REGISTERED in detail
 
 
 class TestMaxParticipants:
     """Tests for max participants validation"""
     
-    def test_signup_respects_max_participants(self, client, reset_activities):
+    def test_signup_respects_max_participants(self, client, activities_store, reset_activities):
         """Test that signup fails when activity is full"""
-        activity = "Chess Club"
-        max_participants = activities[activity]["max_participants"]
-        
-        # Fill up the activity to max capacity
-        activities[activity]["participants"] = [
+        activity = ACT_CHESS
+        chess_club = activities_store[activity]
+        participants = chess_club["participants"]
+        max_participants = chess_club["max_participants"]
+        
+        # Fill up the activity to max capacity, keeping the same dict object
+        participants.clear()
+        participants.update(dict.fromkeys(
             f"student{i}@mergington.edu" for i in range(max_participants)
-        ]
+        ))
         
         # Try to add one more participant
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": "overflow@mergington.edu"}
-        )
+        response = _signup(client, activity, "overflow@mergington.edu")
         
         # Note: This test will fail if max_participants validation isn't implemented
         # You may want to add this validation to your API
@@ -228,28 +208,19 @@ class TestEdgeCases:
     def test_signup_with_special_characters_in_activity_name(self, client):
         """Test handling of special characters in activity name"""
         response = client.post(
-            "/activities/Activity%20With%20Spaces/signup",
-            params={"email": "test@mergington.edu"}
+            f"/activities/Activity%20With%20Spaces/signup?{EMAIL_TEST_QUERY}"
         )
         
         assert response.status_code == 404
     
-    def test_email_validation(self, client, reset_activities):
+    @pytest.mark.parametrize("email", [
+        "simple@mergington.edu",
+        "name.surname@mergington.edu",
+        "name+tag@mergington.edu",
+    ])
+    def test_email_validation(self, client, activities_store, email):
         """Test that various email formats are accepted"""
-        emails = [
-            "simple@mergington.edu",
-            "name.surname@mergington.edu",
-            "name+tag@mergington.edu",
-        ]
-        
-        for email in emails:
-            # Clean up if exists
-            if email in activities["Chess Club"]["participants"]:
-                activities["Chess Club"]["participants"].remove(email)
-            
-            response = client.post(
-                "/activities/Chess Club/signup",
-                params={"email": email}
-            )
-            
-            assert response.status_code == 200, f"Failed for email: {email}"
+        # Clean up if exists
+        activities_store[ACT_CHESS]["participants"].pop(email, None)
+        
+        _assert_signup_ok(client, ACT_CHESS, email)